@@ -43,10 +43,8 @@ class HdfsSensor(BaseSensorOperator):
 
 
 class HdfsRegexSensor(HdfsSensor):  # noqa: D101 Ignore missing docstring
-    def __init__(self, *args, **kwargs):
-        raise RuntimeError(_EXCEPTION_MESSAGE)
+    pass
 
 
 class HdfsFolderSensor(HdfsSensor):  # noqa: D101 Ignore missing docstring
-    def __init__(self, *args, **kwargs):
-        raise RuntimeError(_EXCEPTION_MESSAGE)
+    pass
@@ -19,13 +19,24 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import Any
 
-from github import Github as GithubClient
+import httpx
+from asgiref.sync import sync_to_async
+from github import Consts, Github as GithubClient
 
 from airflow.exceptions import AirflowException
 from airflow.hooks.base import BaseHook
 
+# Clients are shared per process by connection id, so hooks for the same connection do not each
+# fetch the connection and build a new client. Least recently used clients are dropped past the limit.
+_CLIENT_CACHE_SIZE = 32
+_clients: OrderedDict[str, GithubClient] = OrderedDict()
+_clients_lock = threading.Lock()
+
 
 class GithubHook(BaseHook):
     """
@@ -44,14 +55,39 @@ class GithubHook(BaseHook):
     def __init__(self, github_conn_id: str = default_conn_name, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.github_conn_id = github_conn_id
-        self.client: GithubClient | None = None
-        self.get_conn()
+        self._client: GithubClient | None = None
+
+    @property
+    def client(self) -> GithubClient:
+        """GitHub client, created on first access."""
+        return self.get_conn()
+
+    @client.setter
+    def client(self, client: GithubClient | None) -> None:
+        self._client = client
 
     def get_conn(self) -> GithubClient:
         """Initiate a new GitHub connection with token and hostname (for GitHub Enterprise)."""
-        if self.client is not None:
-            return self.client
-
+        if self._client is not None:
+            return self._client
+
+        with _clients_lock:
+            client = _clients.get(self.github_conn_id)
+            if client is not None:
+                _clients.move_to_end(self.github_conn_id)
+        if client is None:
+            client = self._build_client()
+            with _clients_lock:
+                # Another thread may have built a client for the same connection in the meantime
+                client = _clients.setdefault(self.github_conn_id, client)
+                _clients.move_to_end(self.github_conn_id)
+                if len(_clients) > _CLIENT_CACHE_SIZE:
+                    _clients.popitem(last=False)
+
+        self._client = client
+        return self._client
+
+    def _build_client(self) -> GithubClient:
         conn = self.get_connection(self.github_conn_id)
         access_token = conn.password
         host = conn.host
@@ -63,11 +99,14 @@ class GithubHook(BaseHook):
             raise AirflowException("An access token is required to authenticate to GitHub.")
 
         if not host:
-            self.client = GithubClient(login_or_token=access_token)
-        else:
-            self.client = GithubClient(login_or_token=access_token, base_url=host)
+            return GithubClient(login_or_token=access_token)
+        return GithubClient(login_or_token=access_token, base_url=host)
 
-        return self.client
+    def clear_client_cache(self) -> None:
+        """Drop the cached client for this connection, so that the next call re-reads the connection."""
+        with _clients_lock:
+            _clients.pop(self.github_conn_id, None)
+        self._client = None
 
     @classmethod
     def get_ui_field_behaviour(cls) -> dict:
@@ -81,9 +120,56 @@ class GithubHook(BaseHook):
     def test_connection(self) -> tuple[bool, str]:
         """Test GitHub connection."""
         try:
-            if TYPE_CHECKING:
-                assert self.client
-            self.client.get_user().id
+            # Connection tests use throwaway connection ids and fresh credentials, so bypass the cache
+            self._build_client().get_user().id
             return True, "Successfully connected to GitHub."
         except Exception as e:
             return False, str(e)
+
+
+class AsyncGithubHook(BaseHook):
+    """
+    Interact with GitHub asynchronously.
+
+    Returns an ``httpx.AsyncClient`` authenticated against the GitHub REST API which keeps a pool of
+    connections, so that deferrable operators and triggers can send many requests concurrently.
+
+    :param github_conn_id: Reference to :ref:`GitHub connection id <howto/connection:github>`.
+    :param max_connections: Maximum number of connections kept open by the client.
+    """
+
+    conn_name_attr = "github_conn_id"
+    default_conn_name = "github_default"
+    conn_type = "github"
+    hook_name = "GitHub"
+
+    def __init__(
+        self, github_conn_id: str = default_conn_name, *args, max_connections: int = 20, **kwargs
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.github_conn_id = github_conn_id
+        self.max_connections = max_connections
+
+    async def get_conn(self) -> httpx.AsyncClient:
+        """Create an HTTP client with token and hostname (for GitHub Enterprise)."""
+        conn = await sync_to_async(self.get_connection)(self.github_conn_id)
+        if not conn.password:
+            raise AirflowException("An access token is required to authenticate to GitHub.")
+
+        return httpx.AsyncClient(
+            base_url=conn.host or Consts.DEFAULT_BASE_URL,
+            headers={"Authorization": f"token {conn.password}", "Accept": "application/vnd.github+json"},
+            limits=httpx.Limits(max_connections=self.max_connections),
+        )
+
+    async def get_many(self, endpoints: list[str]) -> list[Any]:
+        """
+        Send GET requests to several endpoints concurrently and return their JSON bodies in order.
+
+        :param endpoints: Endpoints relative to the API root, i.e. ``/repos/apache/airflow``.
+        """
+        async with await self.get_conn() as client:
+            responses = await asyncio.gather(*(client.get(endpoint) for endpoint in endpoints))
+        for response in responses:
+            response.raise_for_status()
+        return [response.json() for response in responses]
@@ -17,9 +17,13 @@
 # under the License.
 from __future__ import annotations
 
+import math
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, Callable
+from urllib.parse import urlsplit
 
 from github import GithubException
+from github.PaginatedList import PaginatedList
 
 from airflow.exceptions import AirflowException
 from airflow.models import BaseOperator
@@ -28,6 +32,9 @@ from airflow.providers.github.hooks.github import GithubHook
 if TYPE_CHECKING:
     from airflow.utils.context import Context
 
+# GitHub returns at most 1000 results for search queries, pages past that fail with 422
+_GITHUB_MAX_PAGINATED_RESULTS = 1000
+
 
 class GithubOperator(BaseOperator):
     """Interact and perform actions on GitHub API.
@@ -42,6 +49,10 @@ class GithubOperator(BaseOperator):
     :param github_method: Method name from GitHub Python SDK to be called
     :param github_method_args: Method parameters for the github_method. (templated)
     :param result_processor: Function to further process the response from GitHub API
+    :param concurrent_pages: Number of pages fetched concurrently when the response is paginated.
+        When greater than 1 and the number of results is known and at most 1000, all pages are fetched
+        up front and the response is a list of all items. Otherwise (e.g. for endpoints paged by a
+        ``since`` cursor such as ``get_repos()``), the paginated list is returned unchanged.
     """
 
     template_fields = ("github_method_args",)
@@ -53,6 +64,7 @@ class GithubOperator(BaseOperator):
         github_conn_id: str = "github_default",
         github_method_args: dict | None = None,
         result_processor: Callable | None = None,
+        concurrent_pages: int = 1,
         **kwargs,
     ) -> None:
         super().__init__(**kwargs)
@@ -60,20 +72,158 @@ class GithubOperator(BaseOperator):
         self.method_name = github_method
         self.github_method_args = github_method_args or {}
         self.result_processor = result_processor
+        self.concurrent_pages = concurrent_pages
 
     def execute(self, context: Context) -> Any:
+        # Default method execution is on the top level GitHub client
+        hook = GithubHook(github_conn_id=self.github_conn_id)
         try:
-            # Default method execution is on the top level GitHub client
-            hook = GithubHook(github_conn_id=self.github_conn_id)
             resource = hook.client
 
             github_result = getattr(resource, self.method_name)(**self.github_method_args)
+            if isinstance(github_result, PaginatedList) and self.concurrent_pages > 1:
+                github_result = self._fetch_all_pages(github_result, per_page=resource.per_page)
             if self.result_processor:
                 return self.result_processor(github_result)
 
             return github_result
 
         except GithubException as github_error:
+            # Drop the cached client so that an updated connection is picked up on retry.
+            hook.clear_client_cache()
             raise AirflowException(f"Failed to execute GithubOperator, error: {github_error}")
         except Exception as e:
             raise AirflowException(f"GitHub operator error: {e}")
+
+    def _fetch_all_pages(self, paginated_list: PaginatedList, per_page: int) -> PaginatedList | list:
+        """Fetch all pages of a paginated response concurrently and return their items in order."""
+        total_count = paginated_list.totalCount
+        # totalCount is 0 for endpoints paged by a cursor (no ``last`` link), and search results above
+        # the cap cannot be paged to the end, so fall back to sequential pagination for both.
+        if not 0 < total_count <= _GITHUB_MAX_PAGINATED_RESULTS:
+            self.log.info(
+                "Cannot fetch pages concurrently for %s results, falling back to sequential pagination",
+                total_count,
+            )
+            return paginated_list
+
+        num_pages = math.ceil(total_count / per_page)
+        self.log.info("Fetching %s pages with %s concurrent requests", num_pages, self.concurrent_pages)
+        with ThreadPoolExecutor(max_workers=self.concurrent_pages) as executor:
+            pages = executor.map(paginated_list.get_page, range(num_pages))
+            items = [item for page in pages for item in page]
+        if len(items) != total_count:
+            self.log.warning(
+                "Fetched %s items but GitHub reported %s, the results changed while being fetched",
+                len(items),
+                total_count,
+            )
+        return items
+
+
+class GithubBatchOperator(BaseOperator):
+    """Perform several GitHub API calls over a single GitHub connection.
+
+    GraphQL selections are combined into one aliased query, so a single HTTP request (and a single
+    rate-limit hit) replaces one request per selection. Calls to PyGithub methods that have no
+    GraphQL equivalent are submitted to a thread pool on a shared client. Only methods which send a
+    request when called, such as ``get_repo(full_name_or_id)``, overlap there; lazy results such as
+    ``get_user()`` or a ``PaginatedList`` are fetched later, when accessed (e.g. in ``result_processor``).
+
+    For GitHub Enterprise connections, the GraphQL endpoint is derived from the connection host:
+    ``https://{hostname}/api/v3`` is queried at ``https://{hostname}/api/graphql``.
+
+    .. seealso::
+        For more information on how to use this operator, take a look at the guide:
+        :ref:`howto/operator:GithubBatchOperator`
+
+    :param github_conn_id: Reference to a pre-defined GitHub Connection
+    :param graphql_selections: Mapping of alias to a GraphQL selection on the ``query`` root type,
+        e.g. ``{"issue_1": 'repository(owner: "apache", name: "airflow") { issue(number: 1) { title } }'}``.
+        Aliases must be valid GraphQL names. (templated)
+    :param github_calls: Mapping of alias to a ``(github_method, github_method_args)`` pair called on
+        the top level GitHub client. (templated)
+    :param max_workers: Maximum number of threads used to run ``github_calls``
+    :param result_processor: Function to further process the results, a dict keyed by alias
+    """
+
+    template_fields = ("graphql_selections", "github_calls")
+
+    def __init__(
+        self,
+        *,
+        github_conn_id: str = "github_default",
+        graphql_selections: dict[str, str] | None = None,
+        github_calls: dict[str, tuple[str, dict]] | None = None,
+        max_workers: int = 10,
+        result_processor: Callable | None = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.github_conn_id = github_conn_id
+        self.graphql_selections = graphql_selections or {}
+        self.github_calls = github_calls or {}
+        shared_aliases = self.graphql_selections.keys() & self.github_calls.keys()
+        if shared_aliases:
+            raise ValueError(
+                f"Aliases must be unique across graphql_selections and github_calls, got: "
+                f"{sorted(shared_aliases)}"
+            )
+        self.max_workers = max_workers
+        self.result_processor = result_processor
+
+    def execute(self, context: Context) -> Any:
+        hook = GithubHook(github_conn_id=self.github_conn_id)
+        try:
+            resource = hook.client
+
+            results: dict[str, Any] = {}
+            if self.graphql_selections:
+                results.update(self._run_graphql(hook))
+            if self.github_calls:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    futures = {
+                        alias: executor.submit(getattr(resource, method_name), **(method_args or {}))
+                        for alias, (method_name, method_args) in self.github_calls.items()
+                    }
+                    results.update({alias: future.result() for alias, future in futures.items()})
+
+            if self.result_processor:
+                return self.result_processor(results)
+
+            return results
+
+        except GithubException as github_error:
+            hook.clear_client_cache()
+            raise AirflowException(f"Failed to execute GithubBatchOperator, error: {github_error}")
+        except AirflowException:
+            raise
+        except Exception as e:
+            raise AirflowException(f"GitHub batch operator error: {e}")
+
+    def _run_graphql(self, hook: GithubHook) -> dict[str, Any]:
+        """Send all GraphQL selections as a single aliased query and return the data keyed by alias."""
+        selections = " ".join(f"{alias}: {selection}" for alias, selection in self.graphql_selections.items())
+        query = f"query {{ {selections} }}"
+        requester = hook.client._Github__requester
+        self.log.info("Sending %s GraphQL selections in a single query", len(self.graphql_selections))
+        _, response = requester.requestJsonAndCheck(
+            "POST", self._graphql_url(requester.base_url), input={"query": query}
+        )
+        if response.get("errors"):
+            raise AirflowException(f"GitHub GraphQL query failed: {response['errors']}")
+        return response["data"]
+
+    @staticmethod
+    def _graphql_url(base_url: str) -> str:
+        """Return the GraphQL endpoint matching the REST API base URL of the client."""
+        if urlsplit(base_url).hostname == "api.github.com":
+            return "/graphql"
+        # GitHub Enterprise serves the REST API at /api/v3 and GraphQL at /api/graphql
+        base_url = base_url.rstrip("/")
+        if not base_url.endswith("/v3"):
+            raise AirflowException(
+                f"Cannot derive the GraphQL endpoint from GitHub Enterprise URL {base_url!r}, "
+                f"expected https://{{hostname}}/api/v3"
+            )
+        return f"{base_url[: -len('/v3')]}/graphql"
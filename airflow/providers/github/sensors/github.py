@@ -58,12 +58,22 @@ class GithubSensor(BaseSensorOperator):
 
     def poke(self, context: Context) -> bool:
         hook = GithubHook(github_conn_id=self.github_conn_id)
-        github_result = getattr(hook.client, self.method_name)(**self.method_params)
+        try:
+            github_result = getattr(hook.client, self.method_name)(**self.method_params)
 
-        if self.result_processor:
-            return self.result_processor(github_result)
+            if self.result_processor:
+                return self.result_processor(github_result)
 
-        return github_result
+            return github_result
+        except GithubException:
+            # Drop the cached client so that an updated connection is picked up on the next poke.
+            hook.clear_client_cache()
+            raise
+        except AirflowException as e:
+            # Result processors such as tag_checker wrap the GitHub error
+            if isinstance(e.__cause__, GithubException):
+                hook.clear_client_cache()
+            raise
 
 
 class BaseGithubRepositorySensor(GithubSensor):
@@ -136,7 +146,7 @@ class GithubTagSensor(BaseGithubRepositorySensor):
                 result = self.tag_name in all_tags
 
         except GithubException as github_error:  # type: ignore[misc]
-            raise AirflowException(f"Failed to execute GithubSensor, error: {github_error}")
+            raise AirflowException(f"Failed to execute GithubSensor, error: {github_error}") from github_error
         except Exception as e:
             raise AirflowException(f"GitHub operator error: {e}")
 
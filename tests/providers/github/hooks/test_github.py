@@ -0,0 +1,167 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from airflow.exceptions import AirflowException
+from airflow.models import Connection
+from airflow.providers.github.hooks import github as github_hook_module
+from airflow.providers.github.hooks.github import AsyncGithubHook, GithubHook
+
+
+def github_connection(conn_id: str = "github_default", host: str | None = None) -> Connection:
+    return Connection(conn_id=conn_id, conn_type="github", password="my-access-token", host=host)
+
+
+@pytest.fixture(autouse=True)
+def clear_clients():
+    github_hook_module._clients.clear()
+    yield
+    github_hook_module._clients.clear()
+
+
+class TestGithubHook:
+    @patch.object(GithubHook, "get_connection", side_effect=github_connection)
+    def test_init_does_not_read_connection(self, mock_get_connection):
+        hook = GithubHook()
+
+        mock_get_connection.assert_not_called()
+        hook.get_conn()
+        mock_get_connection.assert_called_once_with("github_default")
+
+    @patch.object(GithubHook, "get_connection", side_effect=github_connection)
+    def test_client_can_be_assigned(self, mock_get_connection):
+        hook = GithubHook()
+        client = object()
+
+        hook.client = client
+
+        assert hook.client is client
+        assert hook.get_conn() is client
+        mock_get_connection.assert_not_called()
+
+
+class TestGithubHookClientCache:
+    @patch.object(GithubHook, "get_connection", side_effect=github_connection)
+    def test_client_is_shared_between_hooks(self, mock_get_connection):
+        first = GithubHook().get_conn()
+        second = GithubHook().get_conn()
+
+        assert first is second
+        mock_get_connection.assert_called_once_with("github_default")
+
+    @patch.object(GithubHook, "get_connection", side_effect=github_connection)
+    def test_clear_client_cache_evicts_only_own_connection(self, mock_get_connection):
+        hook = GithubHook()
+        other_client = GithubHook(github_conn_id="other").get_conn()
+        client = hook.get_conn()
+
+        hook.clear_client_cache()
+
+        assert hook.get_conn() is not client
+        assert GithubHook(github_conn_id="other").get_conn() is other_client
+
+    @patch.object(GithubHook, "get_connection", side_effect=github_connection)
+    def test_cache_is_bounded(self, mock_get_connection):
+        for i in range(github_hook_module._CLIENT_CACHE_SIZE + 1):
+            GithubHook(github_conn_id=f"github_{i}").get_conn()
+
+        assert len(github_hook_module._clients) == github_hook_module._CLIENT_CACHE_SIZE
+        assert "github_0" not in github_hook_module._clients
+
+    @patch("airflow.providers.github.hooks.github.GithubClient")
+    @patch.object(GithubHook, "get_connection", side_effect=github_connection)
+    def test_test_connection_bypasses_cache(self, mock_get_connection, mock_client):
+        mock_client.return_value.get_user.return_value.id = 1
+
+        assert GithubHook(github_conn_id="random-test-conn").test_connection() == (
+            True,
+            "Successfully connected to GitHub.",
+        )
+        assert not github_hook_module._clients
+
+
+class TestAsyncGithubHook:
+    @pytest.fixture
+    def requests(self):
+        return []
+
+    @pytest.fixture
+    def mock_transport(self, requests):
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.url.path.endswith("/missing"):
+                return httpx.Response(404, json={"message": "Not Found"})
+            return httpx.Response(200, json={"path": request.url.path})
+
+        transport = httpx.MockTransport(handler)
+        async_client = httpx.AsyncClient
+        with patch(
+            "airflow.providers.github.hooks.github.httpx.AsyncClient",
+            side_effect=lambda **kwargs: async_client(transport=transport, **kwargs),
+        ):
+            yield transport
+
+    def test_init_forwards_kwargs_to_base_hook(self):
+        hook = AsyncGithubHook(github_conn_id="my_github", max_connections=5, logger_name="my_logger")
+
+        assert hook.github_conn_id == "my_github"
+        assert hook.max_connections == 5
+        assert hook.log.name.endswith("my_logger")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "host, expected_base_url",
+        [
+            (None, "https://api.github.com"),
+            ("https://github.example.com/api/v3", "https://github.example.com/api/v3"),
+        ],
+    )
+    async def test_get_conn(self, mock_transport, host, expected_base_url):
+        with patch.object(AsyncGithubHook, "get_connection", return_value=github_connection(host=host)):
+            client = await AsyncGithubHook().get_conn()
+
+        async with client:
+            assert str(client.base_url).rstrip("/") == expected_base_url
+            assert client.headers["Authorization"] == "token my-access-token"
+
+    @pytest.mark.asyncio
+    async def test_get_conn_requires_token(self):
+        connection = Connection(conn_id="github_default", conn_type="github")
+        with patch.object(AsyncGithubHook, "get_connection", return_value=connection):
+            with pytest.raises(AirflowException, match="An access token is required"):
+                await AsyncGithubHook().get_conn()
+
+    @pytest.mark.asyncio
+    async def test_get_many_keeps_order(self, mock_transport, requests):
+        endpoints = ["/repos/apache/airflow", "/users/octocat", "/orgs/apache"]
+        with patch.object(AsyncGithubHook, "get_connection", return_value=github_connection()):
+            result = await AsyncGithubHook().get_many(endpoints)
+
+        assert result == [{"path": endpoint} for endpoint in endpoints]
+        assert {request.url.path for request in requests} == set(endpoints)
+
+    @pytest.mark.asyncio
+    async def test_get_many_raises_for_status(self, mock_transport):
+        with patch.object(AsyncGithubHook, "get_connection", return_value=github_connection()):
+            with pytest.raises(httpx.HTTPStatusError, match="404"):
+                await AsyncGithubHook().get_many(["/repos/apache/airflow", "/repos/apache/missing"])
@@ -0,0 +1,155 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+
+import pytest
+from github import BadCredentialsException
+from github.PaginatedList import PaginatedList
+
+from airflow.exceptions import AirflowException
+from airflow.providers.github.operators.github import GithubBatchOperator, GithubOperator
+
+
+def paginated_list(total_count: int) -> Mock:
+    result = Mock(spec=PaginatedList)
+    result.totalCount = total_count
+    result.get_page.side_effect = lambda page: [f"item-{page}-{i}" for i in range(30)]
+    return result
+
+
+class TestGithubOperatorConcurrentPages:
+    def run_operator(self, github_result):
+        operator = GithubOperator(task_id="github-test", github_method="get_repos", concurrent_pages=4)
+        with patch("airflow.providers.github.operators.github.GithubHook") as mock_hook:
+            mock_hook.return_value.client.per_page = 30
+            mock_hook.return_value.client.get_repos.return_value = github_result
+            return operator.execute(context={})
+
+    def test_page_numbered_list_is_fetched_concurrently(self):
+        github_result = paginated_list(total_count=90)
+
+        result = self.run_operator(github_result)
+
+        assert github_result.get_page.call_count == 3
+        assert result == [f"item-{page}-{i}" for page in range(3) for i in range(30)]
+
+    @pytest.mark.parametrize(
+        "total_count",
+        [
+            pytest.param(0, id="cursor-paged"),
+            pytest.param(5000, id="search-above-cap"),
+        ],
+    )
+    def test_falls_back_to_sequential_pagination(self, total_count):
+        github_result = paginated_list(total_count=total_count)
+
+        result = self.run_operator(github_result)
+
+        assert result is github_result
+        github_result.get_page.assert_not_called()
+
+
+ISSUE_SELECTION = 'repository(owner: "apache", name: "airflow") { issue(number: 1) { title } }'
+
+
+class TestGithubBatchOperator:
+    @pytest.fixture
+    def mock_hook(self):
+        with patch("airflow.providers.github.operators.github.GithubHook") as mock_hook:
+            requester = mock_hook.return_value.client._Github__requester
+            requester.base_url = "https://api.github.com"
+            requester.requestJsonAndCheck.return_value = (
+                {},
+                {"data": {"issue_1": {"issue": {"title": "t"}}}},
+            )
+            yield mock_hook
+
+    def test_execute(self, mock_hook):
+        client = mock_hook.return_value.client
+        operator = GithubBatchOperator(
+            task_id="github-batch",
+            graphql_selections={"issue_1": ISSUE_SELECTION},
+            github_calls={"repo": ("get_repo", {"full_name_or_id": "apache/airflow"})},
+        )
+
+        result = operator.execute(context={})
+
+        client._Github__requester.requestJsonAndCheck.assert_called_once_with(
+            "POST", "/graphql", input={"query": f"query {{ issue_1: {ISSUE_SELECTION} }}"}
+        )
+        client.get_repo.assert_called_once_with(full_name_or_id="apache/airflow")
+        assert result == {"issue_1": {"issue": {"title": "t"}}, "repo": client.get_repo.return_value}
+
+    def test_execute_with_result_processor(self, mock_hook):
+        operator = GithubBatchOperator(
+            task_id="github-batch",
+            graphql_selections={"issue_1": ISSUE_SELECTION},
+            result_processor=lambda results: results["issue_1"]["issue"]["title"],
+        )
+
+        assert operator.execute(context={}) == "t"
+
+    def test_graphql_errors_are_not_wrapped_twice(self, mock_hook):
+        requester = mock_hook.return_value.client._Github__requester
+        requester.requestJsonAndCheck.return_value = ({}, {"errors": [{"message": "bad field"}]})
+        operator = GithubBatchOperator(
+            task_id="github-batch", graphql_selections={"issue_1": ISSUE_SELECTION}
+        )
+
+        with pytest.raises(AirflowException, match=r"^GitHub GraphQL query failed: .*bad field"):
+            operator.execute(context={})
+        mock_hook.return_value.clear_client_cache.assert_not_called()
+
+    def test_github_error_clears_client_cache(self, mock_hook):
+        requester = mock_hook.return_value.client._Github__requester
+        requester.requestJsonAndCheck.side_effect = BadCredentialsException(
+            401, {"message": "Bad credentials"}
+        )
+        operator = GithubBatchOperator(
+            task_id="github-batch", graphql_selections={"issue_1": ISSUE_SELECTION}
+        )
+
+        with pytest.raises(AirflowException, match="Failed to execute GithubBatchOperator"):
+            operator.execute(context={})
+        mock_hook.return_value.clear_client_cache.assert_called_once()
+
+    def test_shared_aliases_are_rejected(self):
+        with pytest.raises(ValueError, match=r"Aliases must be unique.*\['issue_1'\]"):
+            GithubBatchOperator(
+                task_id="github-batch",
+                graphql_selections={"issue_1": ISSUE_SELECTION},
+                github_calls={"issue_1": ("get_repo", {"full_name_or_id": "apache/airflow"})},
+            )
+
+    @pytest.mark.parametrize(
+        "base_url, expected",
+        [
+            ("https://api.github.com", "/graphql"),
+            ("https://api.github.com/", "/graphql"),
+            ("https://github.example.com/api/v3", "https://github.example.com/api/graphql"),
+            ("https://github.example.com/api/v3/", "https://github.example.com/api/graphql"),
+        ],
+    )
+    def test_graphql_url(self, base_url, expected):
+        assert GithubBatchOperator._graphql_url(base_url) == expected
+
+    def test_graphql_url_rejects_unknown_host(self):
+        with pytest.raises(AirflowException, match="Cannot derive the GraphQL endpoint"):
+            GithubBatchOperator._graphql_url("https://github.example.com/custom")
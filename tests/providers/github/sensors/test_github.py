@@ -0,0 +1,50 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from unittest.mock import Mock, patch
+
+import pytest
+from github import BadCredentialsException
+
+from airflow.exceptions import AirflowException
+from airflow.providers.github.sensors.github import GithubTagSensor
+
+
+class TestGithubTagSensor:
+    @patch("airflow.providers.github.sensors.github.GithubHook")
+    def test_clears_client_cache_on_github_error_in_result_processor(self, mock_hook):
+        repo = Mock()
+        repo.get_tags.side_effect = BadCredentialsException(401, {"message": "Bad credentials"})
+        mock_hook.return_value.client.get_repo.return_value = repo
+        sensor = GithubTagSensor(task_id="tag-sensor", tag_name="v1.0", repository_name="apache/airflow")
+
+        with pytest.raises(AirflowException, match="Bad credentials"):
+            sensor.poke(context={})
+
+        mock_hook.return_value.clear_client_cache.assert_called_once()
+
+    @patch("airflow.providers.github.sensors.github.GithubHook")
+    def test_keeps_client_cache_when_tag_is_missing(self, mock_hook):
+        repo = Mock()
+        repo.get_tags.return_value = []
+        mock_hook.return_value.client.get_repo.return_value = repo
+        sensor = GithubTagSensor(task_id="tag-sensor", tag_name="v1.0", repository_name="apache/airflow")
+
+        assert sensor.poke(context={}) is False
+        mock_hook.return_value.clear_client_cache.assert_not_called()
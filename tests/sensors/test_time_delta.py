@@ -0,0 +1,59 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from airflow.exceptions import AirflowSkipException, TaskDeferred
+from airflow.sensors.time_delta import TimeDeltaSensorAsync
+from airflow.triggers.temporal import DateTimeTrigger
+from airflow.utils import timezone
+
+
+class TestTimeDeltaSensorAsync:
+    def test_does_not_defer_when_target_has_passed(self):
+        sensor = TimeDeltaSensorAsync(task_id="timedelta_sensor_async", delta=timedelta(hours=1))
+
+        assert sensor.execute({"data_interval_end": timezone.utcnow() - timedelta(days=1)}) is None
+
+    def test_defers_when_target_is_in_the_future(self):
+        data_interval_end = timezone.utcnow() + timedelta(days=1)
+        sensor = TimeDeltaSensorAsync(task_id="timedelta_sensor_async", delta=timedelta(hours=1))
+
+        with pytest.raises(TaskDeferred) as exc_info:
+            sensor.execute({"data_interval_end": data_interval_end})
+
+        assert isinstance(exc_info.value.trigger, DateTimeTrigger)
+        assert exc_info.value.trigger.moment == data_interval_end + timedelta(hours=1)
+        assert exc_info.value.method_name == "execute_complete"
+
+    def test_naive_datetime_is_skipped_with_soft_fail(self):
+        sensor = TimeDeltaSensorAsync(
+            task_id="timedelta_sensor_async", delta=timedelta(hours=1), soft_fail=True
+        )
+
+        with pytest.raises(AirflowSkipException):
+            sensor.execute({"data_interval_end": datetime(2020, 1, 1)})
+
+    def test_naive_datetime_raises_without_soft_fail(self):
+        sensor = TimeDeltaSensorAsync(task_id="timedelta_sensor_async", delta=timedelta(hours=1))
+
+        with pytest.raises(TypeError):
+            sensor.execute({"data_interval_end": datetime(2020, 1, 1)})